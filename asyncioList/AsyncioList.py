@@ -9,74 +9,193 @@ from __future__ import annotations
 版本: 1.0
 """
 import asyncio
-from typing import List, Optional, Any, AsyncIterator, TypeVar, Generic
+import sys
+from collections import deque
+from itertools import islice
+from typing import Deque, Iterable, List, Optional, Any, AsyncIterator, TypeVar, Generic
 import warnings
 T = TypeVar('T')
 
+# 超过该规模的排序卸载到线程执行器，避免长时间占住事件循环
+_SORT_OFFLOAD_THRESHOLD = 100_000
+
 
 from .exceptions import AsyncioListError, IndexOutOfBoundsError
 
+try:
+    # 可选的Cython加速扩展，未编译时回退纯Python实现
+    from ._speedups import compact_deque as _compact_deque
+except ImportError:
+    _compact_deque = None
+
 
 class AsyncioList(Generic[T]):
-    """异步列表类，支持异步迭代和并发操作"""
-    def __init__(self, initial_list: Optional[List[T]] = None):
+    """异步列表类，支持异步迭代和并发操作
+
+    单个操作的临界区不含await，在单线程事件循环中同步执行天然原子
+    （GIL下内建容器操作不会让出事件循环），因此不加异步锁；锁只保留
+    给async with上下文管理器，用于把多个操作组合成一个原子区间。
+    组合区间之间互斥；单个操作不参与该互斥。
+    """
+    def __init__(self, initial_list: Optional[Iterable[T]] = None, coalesce_ms: float = 0,
+                 queue_mode: bool = False):
         """初始化AsyncioList实例
 
         Args:
-            initial_list: 初始列表数据，可选
+            initial_list: 初始数据，任意可迭代对象，可选。deque按块
+                分配，单趟消费即可完成构造，不存在list的几何扩容
+                重分配，因此无需预分配
+            coalesce_ms: append合并窗口（毫秒）。大于0时，append先写入
+                本地缓冲，由定时器在窗口到期后一次加锁批量提交，将N次
+                锁获取合并为1次。代价是缓冲中的元素在flush前对读操作
+                不可见。默认0表示关闭。
+            queue_mode: 队列模式。popleft在列表为空时挂起等待新
+                元素而非抛异常，唤醒走与wait_for_change同构的定向
+                Future队列（每个元素唤醒一个消费者），适合生产者/
+                消费者场景。其余方法照常可用。与coalesce_ms互斥。
+                默认关闭。
         """
-        if initial_list is not None and not isinstance(initial_list, list):
-            raise TypeError("initial_list必须是列表类型或None")
-        self._items: List[T] = list(initial_list) if initial_list is not None else []
+        if initial_list is not None and not hasattr(initial_list, '__iter__'):
+            raise TypeError("initial_list必须是可迭代对象或None")
+        if coalesce_ms < 0:
+            raise ValueError("coalesce_ms不能为负数")
+        if queue_mode and coalesce_ms:
+            raise ValueError("queue_mode与coalesce_ms不能同时启用")
+        # 使用deque作为底层存储，头部删除为O(1)，适合队列式用法
+        self._items: Deque[T] = deque(initial_list) if initial_list is not None else deque()
+        # 锁只服务于async with组合区间
         self._lock: asyncio.Lock = asyncio.Lock()
-        self._change_event: asyncio.Event = asyncio.Event()
+        # 显式等待者队列：每个wait_for_change调用注册一个Future，
+        # 变更时逐个resolve——与asyncio.Queue._getters同构
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._coalesce_delay: float = coalesce_ms / 1000.0
+        self._pending: List[T] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # 维护好的长度计数：读方一次属性加载即得，见length()
+        self._count: int = len(self._items)
+        self._queue_mode: bool = queue_mode
+        # 队列模式下阻塞在popleft的消费者，与_waiters同构
+        self._getters: Deque[asyncio.Future] = deque()
+
+    def _wake_waiters(self) -> None:
+        """同步唤醒所有wait_for_change等待者
+
+        不需要持锁：单个操作的临界区是同步执行的，不会与等待者
+        交错，被唤醒的等待者要到下一次事件循环调度才恢复。
+        """
+        while self._waiters:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                fut.set_result(True)
+        # 队列模式下按可用元素数定向唤醒阻塞在popleft的消费者
+        n = len(self._items)
+        while n > 0 and self._getters:
+            fut = self._getters.popleft()
+            if not fut.done():
+                fut.set_result(True)
+                n -= 1
 
     def __repr__(self) -> str:
         """返回对象的字符串表示，用于调试"""
-        return f"AsyncioList(items={self._items!r})"
+        return f"{type(self).__name__}(items={list(self._items)!r})"
 
     async def is_empty(self) -> bool:
         """检查列表是否为空
 
+        读维护好的计数器，无锁，结果为调用时刻的快照。
+
         Returns:
             bool: 如果列表为空则返回True，否则返回False
         """
-        return await self.length() == 0
+        return not self._count
 
     async def append(self, item: T) -> 'AsyncioList[T]':
-        """异步添加元素到列表末尾"""
-        async with self._lock:
-            self._items.append(item)
-            # 只在事件未设置时才触发，避免不必要的唤醒
-            if not self._change_event.is_set():
-                self._change_event.set()
+        """异步添加元素到列表末尾
+
+        批量添加大量元素时应优先使用extend，一次加锁提交一批，
+        避免N次append的N次锁获取开销。
+        """
+        if self._coalesce_delay > 0:
+            # 微缓冲：写入本地缓冲并安排定时flush，一次加锁提交一批
+            self._pending.append(item)
+            if self._flush_handle is None:
+                loop = asyncio.get_running_loop()
+                self._flush_handle = loop.call_later(
+                    self._coalesce_delay, self._flush_pending, loop)
+            return self
+        self._items.append(item)
+        self._count += 1
+        self._wake_waiters()
         return self
 
-    async def extend(self, items: List[T]) -> 'AsyncioList[T]':
-        """异步扩展列表"""
-        if not items:
+    def _flush_pending(self, loop: asyncio.AbstractEventLoop) -> None:
+        """定时器回调：把append缓冲提交为一次批量扩展"""
+        self._flush_handle = None
+        if self._pending:
+            loop.create_task(self._commit_pending())
+
+    async def _commit_pending(self) -> None:
+        self._commit_pending_sync()
+
+    def _commit_pending_sync(self) -> None:
+        """提交append缓冲、取消定时器并唤醒等待者
+
+        非append的变更操作在动手前先调用它对齐状态：保证合并窗口
+        不会打乱与append的先后顺序（extend不会插队到缓冲元素前，
+        clear也不会被迟到的flush撤销）。唤醒在这里做，调用方随后
+        即使抛异常，缓冲提交的变更通知也不会丢。
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
             return
-        async with self._lock:
-            self._items.extend(items)
-            self._change_event.set()
+        batch, self._pending = self._pending, []
+        self._items.extend(batch)
+        self._count += len(batch)
+        self._wake_waiters()
+
+    async def extend(self, items: Iterable[T]) -> 'AsyncioList[T]':
+        """异步扩展列表
+
+        一次调用、一次变更通知，批量场景应优先于循环append。
+        接受任意可迭代对象，包括生成器等无len()的输入。
+        """
+        if self._coalesce_delay > 0:
+            self._commit_pending_sync()
+        # 从容器自身算增量，生成器等无长度的输入也能正确计数
+        before = len(self._items)
+        self._items.extend(items)
+        added = len(self._items) - before
+        if not added:
+            return self
+        self._count += added
+        self._wake_waiters()
+        return self
 
     async def insert(self, index: int, item: T) -> 'AsyncioList[T]':
-        """异步在指定位置插入元素"""
-        async with self._lock:
-            try:
-                self._items.insert(index, item)
-            except IndexError as e:
-                raise IndexOutOfBoundsError(f"索引 {index} 超出列表范围，当前列表长度为 {len(self._items)}") from e
-            self._change_event.set()
+        """异步在指定位置插入元素
+
+        与list.insert一致，越界索引会被截断到两端而不是报错。
+        """
+        if self._coalesce_delay > 0:
+            self._commit_pending_sync()
+        self._items.insert(index, item)
+        self._count += 1
+        self._wake_waiters()
+        return self
 
     async def remove(self, item: T) -> 'AsyncioList[T]':
         """异步移除第一个出现的元素"""
-        async with self._lock:
-            try:
-                self._items.remove(item)
-            except ValueError as e:
-                raise AsyncioListError(f"元素 {item} 不在列表中") from e
-            self._change_event.set()
+        if self._coalesce_delay > 0:
+            self._commit_pending_sync()
+        try:
+            self._items.remove(item)
+        except ValueError as e:
+            raise AsyncioListError(f"元素 {item} 不在列表中") from e
+        self._count -= 1
+        self._wake_waiters()
+        return self
 
     async def pop(self, index: int = -1) -> T:
         """异步移除并返回指定位置的元素
@@ -90,59 +209,160 @@ class AsyncioList(Generic[T]):
         Raises:
             IndexError: 如果索引超出范围
         """
-        async with self._lock:
-            try:
-                result = self._items.pop(index)
-                if not self._change_event.is_set():
-                    self._change_event.set()
-                return result
-            except IndexError as e:
-                raise IndexOutOfBoundsError(f"索引 {index} 超出列表范围，当前列表长度为 {len(self._items)}") from e
+        if self._coalesce_delay > 0:
+            self._commit_pending_sync()
+        # 显式边界检查代替try/except：happy path不付异常表代价
+        n = len(self._items)
+        if index >= n or index < -n:
+            raise IndexOutOfBoundsError(f"索引 {index} 超出列表范围，当前列表长度为 {n}")
+        result = self._pop_at(index)
+        self._count -= 1
+        self._wake_waiters()
+        return result
+
+    def _pop_at(self, index: int) -> T:
+        """同步移除并返回指定位置的元素（调用方负责互斥）"""
+        # deque两端删除为O(1)，其余位置退化为O(n)的del
+        if index == 0:
+            return self._items.popleft()
+        if index == -1:
+            return self._items.pop()
+        result = self._items[index]
+        del self._items[index]
+        return result
+
+    async def popleft(self) -> T:
+        """异步移除并返回首个元素（O(1)，队列场景优先使用）
+
+        队列模式下列表为空时挂起等待新元素，而不是抛出异常。
+
+        Returns:
+            T: 被移除的首个元素
+
+        Raises:
+            IndexOutOfBoundsError: 如果列表为空（非队列模式）
+        """
+        if self._queue_mode:
+            # 空则注册getter挂起等待；被唤醒后重查，元素可能已被
+            # 其他消费者取走
+            while not self._items:
+                fut = asyncio.get_running_loop().create_future()
+                self._getters.append(fut)
+                try:
+                    await fut
+                finally:
+                    # 被唤醒的Future已在_wake_waiters中弹出；取消的要摘掉
+                    try:
+                        self._getters.remove(fut)
+                    except ValueError:
+                        pass
+            result = self._items.popleft()
+            self._count -= 1
+            self._wake_waiters()
+            return result
+        if self._coalesce_delay > 0:
+            self._commit_pending_sync()
+        if not self._items:
+            raise IndexOutOfBoundsError("列表为空，无法移除首个元素")
+        result = self._items.popleft()
+        self._count -= 1
+        self._wake_waiters()
+        return result
+
+    async def drain(self, max_items: Optional[int] = None) -> List[T]:
+        """异步从头部批量取出元素
+
+        一次调用取走最多max_items个头部元素（None表示取空），替代
+        `while not await is_empty(): await popleft()`式的逐个轮询：
+        N个元素只花一次协程往返和一次变更通知。
+
+        Args:
+            max_items: 最多取出的元素数量，None表示全部
+
+        Returns:
+            List[T]: 取出的元素，保持原顺序；列表为空时为空列表
+        """
+        if self._coalesce_delay > 0:
+            self._commit_pending_sync()
+        n = len(self._items)
+        if max_items is not None:
+            n = min(max_items, n)
+        if n <= 0:
+            return []
+        popleft = self._items.popleft
+        out = [popleft() for _ in range(n)]
+        self._count -= n
+        self._wake_waiters()
+        return out
 
     async def clear(self) -> 'AsyncioList[T]':
         """异步清空列表"""
-        async with self._lock:
-            self._items.clear()
-            self._change_event.set()
+        if self._coalesce_delay > 0:
+            # 连同未flush的append缓冲一起清空，clear不能被迟到的flush撤销
+            self._commit_pending_sync()
+        self._items.clear()
+        self._count = 0
+        self._wake_waiters()
+        return self
 
-    async def index(self, item: Any, start: int = 0, end: Optional[int] = None) -> int:
-        """异步返回元素第一次出现的索引"""
-        async with self._lock:
-            try:
-                if end is None:
-                    return self._items.index(item, start)
-                else:
-                    return self._items.index(item, start, end)
-            except ValueError as e:
-                raise AsyncioListError(f"元素 {item} 不在列表中") from e
+    async def index(self, item: Any, start: int = 0, end: int = sys.maxsize) -> int:
+        """异步返回元素第一次出现的索引
+
+        end以sys.maxsize为哨兵默认值，C层会自行截断越界上界，
+        因此只需一条代码路径，没有end is None分支。
+        """
+        try:
+            return self._items.index(item, start, end)
+        except ValueError as e:
+            raise AsyncioListError(f"元素 {item} 不在列表中") from e
 
     async def count(self, item: T) -> int:
         """异步返回元素出现的次数"""
-        async with self._lock:
-            return self._items.count(item)
+        return self._items.count(item)
 
     async def contains(self, item: T) -> bool:
-        """异步检查元素是否存在于列表中"""
-        async with self._lock:
-            return item in self._items
+        """异步检查元素是否存在于列表中
+
+        无锁读取：in运算在GIL下不会让出事件循环，结果为调用时刻的快照。
+        """
+        return item in self._items
 
     async def slice(self, start: int, stop: int, step: int = 1) -> List[T]:
         """异步获取列表切片"""
-        async with self._lock:
-            return self._items[start:stop:step]
+        try:
+            return list(islice(self._items, start, stop, step))
+        except ValueError:
+            # islice不支持负索引/负步长，回退到物化列表再切片
+            return list(self._items)[start:stop:step]
 
     async def reverse(self) -> 'AsyncioList[T]':
         """异步反转列表并返回自身以支持链式调用"""
-        async with self._lock:
-            self._items.reverse()
-            self._change_event.set()
+        if self._coalesce_delay > 0:
+            self._commit_pending_sync()
+        self._items.reverse()
+        self._wake_waiters()
         return self
 
     async def sort(self, **kwargs) -> 'AsyncioList[T]':
-        """异步排序列表并返回自身以支持链式调用"""
-        async with self._lock:
-            self._items.sort(** kwargs)
-            self._change_event.set()
+        """异步排序列表并返回自身以支持链式调用
+
+        快照-排序-回填：大列表的排序卸载到线程执行器，排序期间
+        事件循环保持响应。代价是卸载排序期间发生的并发修改会被
+        回填覆盖。回填为原地操作，_items身份不变。
+        """
+        if self._coalesce_delay > 0:
+            self._commit_pending_sync()
+        snapshot = list(self._items)
+        if len(snapshot) >= _SORT_OFFLOAD_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, lambda: snapshot.sort(**kwargs))
+        else:
+            snapshot.sort(**kwargs)
+        src = self._items
+        src.clear()
+        src.extend(snapshot)
+        self._count = len(src)
+        self._wake_waiters()
         return self
 
     async def get(self, index: int) -> T:
@@ -157,10 +377,9 @@ class AsyncioList(Generic[T]):
         Raises:
             IndexOutOfBoundsError: 如果索引超出范围
         """
-        async with self._lock:
-            if index < 0 or index >= len(self._items):
-                raise IndexOutOfBoundsError(f"索引 {index} 超出列表范围，当前列表长度为 {len(self._items)}")
-            return self._items[index]
+        if index < 0 or index >= len(self._items):
+            raise IndexOutOfBoundsError(f"索引 {index} 超出列表范围，当前列表长度为 {len(self._items)}")
+        return self._items[index]
 
     def __len__(self) -> int:
         """返回列表长度（同步方法，支持len()调用）
@@ -169,57 +388,88 @@ class AsyncioList(Generic[T]):
         """
         
         warnings.warn("使用同步len()方法可能返回过时数据，建议使用异步length()方法", stacklevel=2)
-        return len(self._items)
+        return self._count
 
     async def length(self) -> int:
         """异步返回列表长度
 
+        读维护好的计数器：一次属性加载，无锁、无内建调用。结果为
+        调用时刻的快照。
+
         Returns:
             int: 当前列表中的元素数量
         """
-        async with self._lock:
-            return len(self._items)
+        return self._count
 
 
     async def delete_all(self, item: T) -> 'AsyncioList[T]':
-        """异步删除所有与传入对象相等的元素"""
-        async with self._lock:
-            self._items = [i for i in self._items if i != item]
-            self._change_event.set()
+        """异步删除所有与传入对象相等的元素
+
+        原地轮转压缩：逐个popleft并把保留元素append回尾部，顺序不变，
+        不分配新容器，峰值内存为O(1)而非O(n)。
+        """
+        if self._coalesce_delay > 0:
+            self._commit_pending_sync()
+        if _compact_deque is not None:
+            self._count = _compact_deque(self._items, item)
+        else:
+            src = self._items
+            for _ in range(len(src)):
+                value = src.popleft()
+                if value != item:
+                    src.append(value)
+            # 压缩后重算计数
+            self._count = len(src)
+        self._wake_waiters()
+        return self
 
     async def __aiter__(self) -> AsyncIterator[T]:
         """异步迭代器支持
 
         注意：迭代过程中不会反映迭代开始后的列表变化
         """
-        async with self._lock:
-            # 创建当前状态的快照进行迭代
-            items = list(self._items)
+        # 创建当前状态的快照进行迭代；copy()走C层快照路径，
+        # 比list()的逐元素迭代协议更快
+        items = self._items.copy()
         for item in items:
             yield item
 
     async def wait_for_change(self, timeout: Optional[float] = None) -> bool:
         """等待列表发生变化
 
+        每个调用注册一个独立的Future，变更方逐个resolve，不存在
+        共享Event复位竞争导致的丢失唤醒，多个等待者互不影响。只
+        等待调用之后发生的变化。
+
         Args:
             timeout: 超时时间（秒），None表示无限等待
 
         Returns:
-            bool: 如果事件被触发则返回True，如果超时则返回False
+            bool: 如果列表发生变化则返回True，如果超时则返回False
         """
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
         try:
-            await asyncio.wait_for(self._change_event.wait(), timeout)
+            await asyncio.wait_for(fut, timeout)
             return True
         except asyncio.TimeoutError:
             return False
         finally:
-            # 重置事件，为下一次等待做准备
-            self._change_event.clear()
+            # 被唤醒的Future已在_wake_waiters中弹出；超时的要摘掉
+            try:
+                self._waiters.remove(fut)
+            except ValueError:
+                pass
 
     async def __aenter__(self) -> 'AsyncioList[T]':
+        if self._coalesce_delay > 0:
+            # 组合区间直接操作_items，进入前先对齐append缓冲
+            self._commit_pending_sync()
         await self._lock.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        self._lock.release()
-        self._change_event.set()
\ No newline at end of file
+        # 组合区间内可能直接改动_items，退出时重新同步计数
+        self._count = len(self._items)
+        self._wake_waiters()
+        self._lock.release()
\ No newline at end of file
@@ -1,5 +1,6 @@
 from .AsyncioList import AsyncioList
 from .exceptions import AsyncioListError, IndexOutOfBoundsError
+from .numeric import NumericAsyncioList
 
 __version__ = "1.0"
 __author__ = "303_SeeOther"
@@ -0,0 +1,31 @@
+# cython: language_level=3
+"""asyncioList可选加速扩展
+
+编译安装时（需要Cython）提供热点循环的C级实现；未编译时包自动
+回退到纯Python路径，功能完全一致。
+
+作者: 303_SeeOther
+邮箱: l.z.cheng.1106@gmail.com
+版本: 1.0
+"""
+
+
+def compact_deque(object src, object item):
+    """原地轮转压缩：删除src中所有等于item的元素
+
+    与AsyncioList.delete_all的纯Python循环语义一致：逐个popleft，
+    保留元素append回尾部，顺序不变，O(1)额外内存。编译后循环体
+    不经过字节码解释器。
+
+    Returns:
+        Py_ssize_t: 压缩后的元素数量
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = len(src)
+    popleft = src.popleft
+    append = src.append
+    for i in range(n):
+        value = popleft()
+        if value != item:
+            append(value)
+    return len(src)
@@ -0,0 +1,146 @@
+"""asyncioList数值加速模块
+
+为纯数值列表提供可选的numba批量查询加速：count/index/delete_all
+走@njit编译的内核，其余操作沿用AsyncioList。numba/numpy不可用时
+自动回退到纯Python实现，安装依赖保持为零。
+
+作者: 303_SeeOther
+邮箱: l.z.cheng.1106@gmail.com
+版本: 1.0
+"""
+import sys
+
+from typing import Any, Iterable, Optional
+
+from .AsyncioList import AsyncioList
+from .exceptions import AsyncioListError
+
+try:
+    import numpy as np
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    np = None
+    njit = None
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+    # cache=True把编译结果落盘，避免每次进程启动重新编译
+
+    @njit(cache=True)
+    def _count_nb(arr, value):
+        n = 0
+        for v in arr:
+            if v == value:
+                n += 1
+        return n
+
+    @njit(cache=True)
+    def _index_nb(arr, value, start, end):
+        for i in range(start, end):
+            if arr[i] == value:
+                return i
+        return -1
+
+    @njit(cache=True)
+    def _delete_all_nb(arr, value):
+        out = np.empty(arr.shape[0], arr.dtype)
+        n = 0
+        for v in arr:
+            if v != value:
+                out[n] = v
+                n += 1
+        return out[:n]
+
+
+class NumericAsyncioList(AsyncioList[Any]):
+    """数值异步列表，批量查询走numba编译的内核
+
+    存储沿用父类的deque，查询时物化为定长dtype的numpy数组交给
+    @njit内核，对大列表通常有一个数量级以上的加速。元素应当是
+    与dtype兼容的数值标量；遇到无法转换的元素或numba缺失时，
+    自动回退父类的纯Python路径。
+    """
+
+    def __init__(self, initial_list: Optional[Iterable[Any]] = None,
+                 dtype: str = 'int64', **kwargs) -> None:
+        """初始化NumericAsyncioList实例
+
+        Args:
+            initial_list: 初始列表数据，可选
+            dtype: numpy数组的元素类型，默认'int64'
+            **kwargs: 透传给AsyncioList（如coalesce_ms）
+        """
+        super().__init__(initial_list, **kwargs)
+        self._dtype = np.dtype(dtype) if _HAS_NUMBA else dtype
+
+    def _as_array(self):
+        """把当前元素物化为定长numpy数组（调用时刻的快照）
+
+        存储元素超出dtype范围时（如int64列表里混入2**100或inf），
+        np.fromiter抛OverflowError，与_as_scalar一样统一转成
+        ValueError，让调用方走纯Python回退路径。
+        """
+        try:
+            return np.fromiter(self._items, self._dtype, len(self._items))
+        except OverflowError as e:
+            raise ValueError(f"存在无法精确转换为{self._dtype}的元素") from e
+
+    def _as_scalar(self, item: Any):
+        """把查询值精确转换为dtype标量；无法精确表示时抛ValueError
+
+        内核拿到的必须是与数组同dtype的标量，否则numba在调用点
+        报TypingError；截断式转换（如int64数组查2.5）则会查错值。
+        超出dtype范围的值（如int64数组查2**100或inf）numpy抛
+        OverflowError，统一转成ValueError让调用方走回退路径。
+        """
+        try:
+            value = self._dtype.type(item)
+        except OverflowError as e:
+            raise ValueError(f"{item!r}无法精确转换为{self._dtype}") from e
+        if value != item:
+            raise ValueError(f"{item!r}无法精确转换为{self._dtype}")
+        return value
+
+    async def count(self, item: Any) -> int:
+        """异步返回元素出现的次数（numba内核加速）"""
+        if not _HAS_NUMBA or not self._items:
+            return await super().count(item)
+        try:
+            arr = self._as_array()
+            value = self._as_scalar(item)
+        except (TypeError, ValueError):
+            return await super().count(item)
+        return int(_count_nb(arr, value))
+
+    async def index(self, item: Any, start: int = 0, end: int = sys.maxsize) -> int:
+        """异步返回元素第一次出现的索引（numba内核加速）"""
+        if not _HAS_NUMBA or not self._items or start < 0 or end < 0:
+            return await super().index(item, start, end)
+        try:
+            arr = self._as_array()
+            value = self._as_scalar(item)
+        except (TypeError, ValueError):
+            return await super().index(item, start, end)
+        stop = min(end, len(arr))
+        found = int(_index_nb(arr, value, min(start, len(arr)), stop))
+        if found < 0:
+            raise AsyncioListError(f"元素 {item} 不在列表中")
+        return found
+
+    async def delete_all(self, item: Any) -> 'NumericAsyncioList':
+        """异步删除所有与传入对象相等的元素（numba内核加速）"""
+        if not _HAS_NUMBA or not self._items:
+            return await super().delete_all(item)
+        try:
+            arr = self._as_array()
+            value = self._as_scalar(item)
+        except (TypeError, ValueError):
+            return await super().delete_all(item)
+        kept = _delete_all_nb(arr, value)
+        self._items.clear()
+        self._items.extend(kept.tolist())
+        self._count = len(self._items)
+        self._wake_waiters()
+        return self
@@ -32,11 +32,11 @@ async def consumer(name: str, queue: AsyncioList, producers_done: asyncio.Event)
             break
 
         if changed or not await queue.is_empty():
-            # 处理所有可用元素
+            # 一次drain批量取走积压元素，免去逐个popleft的轮询
             while not await queue.is_empty():
-                item = await queue.pop(0)  # 取出首个元素
-                await asyncio.sleep(random.uniform(0.2, 0.6))  # 模拟处理耗时
-                print(f"消费者{name} 处理完成: {item} | 剩余: {await queue.length()}")
+                for item in await queue.drain():
+                    await asyncio.sleep(random.uniform(0.2, 0.6))  # 模拟处理耗时
+                    print(f"消费者{name} 处理完成: {item} | 剩余: {await queue.length()}")
 
 
 # 运行示例
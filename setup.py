@@ -1,5 +1,16 @@
 from setuptools import setup, find_packages
 
+try:
+    # 可选：装了Cython且源码里带.pyx时编译加速扩展，否则发纯Python包
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    if __import__("os").path.exists("asyncioList/_speedups.pyx"):
+        ext_modules = cythonize(["asyncioList/_speedups.pyx"], language_level="3")
+    else:
+        ext_modules = []
+
 setup(
     name="asyncioList",
     version="1.0",
@@ -10,6 +21,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/303-SeeOther/asyncioList",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[],
     keywords=["asyncio", "list", "concurrency"],
     classifiers=[